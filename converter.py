@@ -12,39 +12,123 @@ Usage:
 If output_folder is not specified, creates a 'converted' subfolder in input_folder.
 """
 
+import io
 import os
 import sys
+import json
+import mmap
 import shutil
+import hashlib
 import argparse
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
 
 import h5py
 import numpy as np
+import PIL
 from PIL import Image
 from tqdm import tqdm
 
 
-def find_ultrasound_data(hdf_file):
+# Default size below which files are assumed to be settings-only and skipped
+# without opening HDF5 (sample settings .usr files are ~180 KiB). Small
+# acquisitions would be skipped too, so it can be lowered or disabled.
+SETTINGS_SIZE_THRESHOLD = 256 * 1024
+
+# HDF5 chunk cache per open file (the library default is 1 MB), large enough
+# that chunked tissue datasets are decompressed only once
+HDF5_CHUNK_CACHE_BYTES = 16 * 1024 * 1024
+
+# Hash slots for the chunk cache: a prime well above the number of chunks
+# that fit in HDF5_CHUNK_CACHE_BYTES
+HDF5_CHUNK_CACHE_SLOTS = 10007
+
+# Filters whose plugins each worker looks up at startup: gzip, shuffle, LZF,
+# bitshuffle. Speculative: the sample files use no filters at all, and this
+# only moves the one-time plugin lookup out of the first compressed read
+HDF5_FILTER_IDS = (1, 2, 32000, 32008)
+
+# File in the output folder remembering which inputs are settings-only, keyed
+# by size and a hash of the first FINGERPRINT_BYTES, so reruns skip them
+# without opening HDF5
+FINGERPRINT_CACHE_NAME = '.usrconverter_cache.json'
+FINGERPRINT_BYTES = 4096
+
+# zlib level for PNG output; 1 is several times faster to encode than PIL's
+# default of 6 for only slightly larger files
+DEFAULT_PNG_LEVEL = 1
+
+# Block alignment required for O_DIRECT buffers, offsets and lengths
+DIRECT_IO_ALIGNMENT = 4096
+
+
+# Image datasets probed by find_ultrasound_data before it walks the whole
+# file. Unverified guesses: only MovieGroup1/AcqTissue has been seen in real
+# files, and these assume other acquisition modes and movie groups mirror it.
+# A wrong guess costs one failed lookup before the full walk
+FALLBACK_PATHS = [
+    'MovieGroup1/AcqColor/RawData/RawDataUnit',
+    'MovieGroup1/AcqPower/RawData/RawDataUnit',
+    'MovieGroup2/AcqTissue/RawData/RawDataUnit',
+    'MovieGroup2/AcqColor/RawData/RawDataUnit',
+]
+
+
+def open_hdf5(path):
+    """Open an HDF5 file read-only with the enlarged chunk cache."""
+    return h5py.File(path, 'r', rdcc_nbytes=HDF5_CHUNK_CACHE_BYTES, rdcc_nslots=HDF5_CHUNK_CACHE_SLOTS)
+
+
+def _image_type(obj):
+    """Classify an HDF5 object as an image type, or return None."""
+    if not isinstance(obj, h5py.Dataset):
+        return None
+
+    shape = obj.shape
+    dtype = obj.dtype
+
+    # Look for 2D or 3D uint8 arrays that could be images
+    if dtype == np.uint8 and len(shape) >= 2:
+        # Check if it's reasonably sized for an image
+        if len(shape) == 2 and shape[0] > 50 and shape[1] > 50:
+            return 'grayscale_2d'
+        elif len(shape) == 3 and shape[0] >= 1 and shape[1] > 50 and shape[2] > 50:
+            return 'grayscale_3d'
+        elif len(shape) == 3 and shape[2] in [3, 4] and shape[0] > 50 and shape[1] > 50:
+            return 'color'
+    return None
+
+
+def find_ultrasound_data(hdf_file, limit=None):
     """
     Search for ultrasound image data in HDF5 file.
-    Returns list of (path, dataset) tuples for found image data.
+    Returns list of (path, image type) tuples for found image data.
+
+    Known FALLBACK_PATHS are probed first; only if none of them hold an image
+    is the whole tree visited, stopping as soon as limit candidates have been
+    found.
     """
     images = []
+    for path in FALLBACK_PATHS:
+        try:
+            img_type = _image_type(hdf_file[path])
+        except KeyError:
+            continue
+        if img_type is not None:
+            images.append((path, img_type))
+            if limit is not None and len(images) >= limit:
+                break
+    if images:
+        return images
 
     def visitor(name, obj):
-        if isinstance(obj, h5py.Dataset):
-            shape = obj.shape
-            dtype = obj.dtype
-
-            # Look for 2D or 3D uint8 arrays that could be images
-            if dtype == np.uint8 and len(shape) >= 2:
-                # Check if it's reasonably sized for an image
-                if len(shape) == 2 and shape[0] > 50 and shape[1] > 50:
-                    images.append((name, 'grayscale_2d'))
-                elif len(shape) == 3 and shape[0] >= 1 and shape[1] > 50 and shape[2] > 50:
-                    images.append((name, 'grayscale_3d'))
-                elif len(shape) == 3 and shape[2] in [3, 4] and shape[0] > 50 and shape[1] > 50:
-                    images.append((name, 'color'))
+        img_type = _image_type(obj)
+        if img_type is not None:
+            images.append((name, img_type))
+            # Returning a value stops visititems early
+            if limit is not None and len(images) >= limit:
+                return True
 
     hdf_file.visititems(visitor)
     return images
@@ -61,12 +145,19 @@ def extract_raw_ultrasound(hdf_file):
 
     for path in raw_paths:
         try:
-            data = hdf_file[path][:]
-            if data is not None and data.size > 1000:
-                # Remove leading singleton dimensions
-                while len(data.shape) > 2 and data.shape[0] == 1:
-                    data = data[0]
-                return data, path
+            dataset = hdf_file[path]
+            if not isinstance(dataset, h5py.Dataset) or dataset.size <= 1000:
+                continue
+
+            # Remove leading singleton dimensions
+            shape = dataset.shape
+            while len(shape) > 2 and shape[0] == 1:
+                shape = shape[1:]
+
+            # Read straight into a single buffer, then drop the singleton dims as a view
+            data = np.empty(dataset.shape, dtype=dataset.dtype)
+            dataset.read_direct(data)
+            return data.reshape(shape), path
         except (KeyError, ValueError):
             continue
 
@@ -91,16 +182,24 @@ def extract_preview_image(hdf_file):
             bpp = int(hdf_file[bpp_path][0])
 
             if bpp == 32:
-                # BGRA format
-                img_array = np.frombuffer(data, dtype=np.uint8).reshape((height, width, 4))
-                img_array = img_array[:, :, [2, 1, 0, 3]]  # BGRA to RGBA
-                img_array = np.flipud(img_array)  # BMP is bottom-up
+                # BGRA format: view each pixel as one little-endian uint32 and
+                # swap the B and R bytes with bitwise ops, flipping rows as we
+                # go (BMP is bottom-up)
+                pixels = np.frombuffer(data, dtype='<u4').reshape((height, width))[::-1]
+                rgba = np.bitwise_and(pixels, 0xFF00FF00)
+                swapped = np.right_shift(pixels, 16)
+                swapped &= 0x000000FF
+                rgba |= swapped
+                np.left_shift(pixels, 16, out=swapped)
+                swapped &= 0x00FF0000
+                rgba |= swapped
+                img_array = rgba.view(np.uint8).reshape((height, width, 4))
                 return img_array, 'RGBA', data_path
             elif bpp == 24:
                 # BGR format
                 img_array = np.frombuffer(data, dtype=np.uint8).reshape((height, width, 3))
-                img_array = img_array[:, :, ::-1]  # BGR to RGB
-                img_array = np.flipud(img_array)
+                # BGR to RGB and flip as a strided view; PIL copies it once
+                img_array = img_array[::-1, :, ::-1]
                 return img_array, 'RGB', data_path
         except (KeyError, ValueError) as e:
             continue
@@ -117,13 +216,108 @@ def enhance_ultrasound_image(img_array, apply_clahe=True):
     img_max = img_array.max()
 
     if img_max > img_min:
-        normalized = ((img_array - img_min) / (img_max - img_min) * 255).astype(np.uint8)
+        if img_array.dtype == np.uint8:
+            # Stretch the 256 possible values once and apply as a lookup table,
+            # avoiding full-size float intermediates
+            levels = np.arange(256)
+            lut = ((levels - int(img_min)) / (int(img_max) - int(img_min)) * 255)
+            lut = np.clip(lut, 0, 255).astype(np.uint8)
+            if img_array.flags['C_CONTIGUOUS']:
+                # bytes.translate is a tight C loop over a 256-byte table and
+                # beats numpy's fancy-index gather on uint8 buffers
+                translated = bytearray(img_array).translate(lut.tobytes())
+                normalized = np.frombuffer(translated, dtype=np.uint8).reshape(img_array.shape)
+            else:
+                normalized = lut[img_array]
+        else:
+            # Stretch in place in a single working buffer instead of allocating
+            # a new full-size temporary for each arithmetic step
+            if np.issubdtype(img_array.dtype, np.integer):
+                work = np.subtract(img_array, img_min, dtype=np.float64)
+            else:
+                work = img_array - img_min
+            work /= img_max - img_min
+            work *= 255
+            normalized = work.astype(np.uint8)
     else:
         normalized = img_array.astype(np.uint8)
 
     return normalized
 
 
+def image_from_array(img_array, mode):
+    """
+    Wrap a uint8 array as a PIL image of the given mode.
+
+    C-contiguous arrays are shared with PIL rather than copied (for modes PIL
+    can map directly, such as 'L' and 'RGBA'); strided views are made
+    contiguous first.
+    """
+    if img_array.dtype != np.uint8:
+        raise ValueError(f"cannot make a {mode} image from a {img_array.dtype} array")
+
+    # Single-band modes take (height, width); others (height, width, bands)
+    bands = Image.getmodebands(mode)
+    if img_array.ndim < 2 or img_array.shape[2:] != ((bands,) if bands > 1 else ()):
+        raise ValueError(f"cannot make a {mode} image from an array of shape {img_array.shape}")
+
+    img_array = np.ascontiguousarray(img_array)
+    height, width = img_array.shape[:2]
+    return Image.frombuffer(mode, (width, height), img_array, 'raw', mode, 0, 1)
+
+
+def _write_direct(output_path, data):
+    """
+    Write data to output_path with O_DIRECT, bypassing the page cache.
+
+    The data is copied into a page-aligned buffer padded to
+    DIRECT_IO_ALIGNMENT, and the file is truncated back to its real length.
+    Raises OSError where the filesystem does not support O_DIRECT, including
+    short or misaligned writes that cannot be continued.
+    """
+    size = len(data)
+    padded_size = max(DIRECT_IO_ALIGNMENT, -(-size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT)
+
+    with mmap.mmap(-1, padded_size) as buf:
+        buf[:size] = data
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+        try:
+            # Views must be released before the mmap closes, even on error
+            with memoryview(buf) as view:
+                written = 0
+                while written < padded_size:
+                    with view[written:] as remaining:
+                        count = os.write(fd, remaining)
+                    # The next O_DIRECT write would start at an unaligned offset
+                    if count <= 0 or count % DIRECT_IO_ALIGNMENT:
+                        raise OSError(f"short O_DIRECT write to {output_path} ({count} bytes)")
+                    written += count
+            os.ftruncate(fd, size)
+        finally:
+            os.close(fd)
+
+
+def save_png(img, output_path, png_level=DEFAULT_PNG_LEVEL, direct_io=False):
+    """
+    Save a PIL image as PNG with the given zlib compression level.
+
+    With direct_io, the encoded PNG is written with O_DIRECT so large batches
+    don't evict other data from the page cache; filesystems without O_DIRECT
+    support (e.g. tmpfs) get a normal write.
+    """
+    if not (direct_io and hasattr(os, 'O_DIRECT')):
+        img.save(output_path, format='PNG', compress_level=png_level, optimize=False)
+        return
+
+    encoded = io.BytesIO()
+    img.save(encoded, format='PNG', compress_level=png_level, optimize=False)
+    try:
+        _write_direct(output_path, encoded.getbuffer())
+    except OSError:
+        with open(output_path, 'wb') as f:
+            f.write(encoded.getbuffer())
+
+
 def is_settings_file(hdf_file):
     """
     Check if the HDF5 file is a settings/config file (no image data).
@@ -138,7 +332,21 @@ def is_settings_file(hdf_file):
     return False
 
 
-def convert_file(input_path, output_dir, relative_path=None, verbose=True):
+# Messages from the file being converted in this worker process, or None to
+# print them straight away
+_log_buffer = None
+
+
+def _log(message):
+    """Print a per-file progress message, or buffer it inside a worker."""
+    if _log_buffer is None:
+        tqdm.write(message)
+    else:
+        _log_buffer.append(message)
+
+
+def convert_file(input_path, output_dir, relative_path=None, verbose=True, high_quality=False,
+                 png_level=DEFAULT_PNG_LEVEL, direct_io=False, preview_only=False, raw_only=False):
     """
     Convert a single .usr or .raw file to PNG.
 
@@ -147,6 +355,11 @@ def convert_file(input_path, output_dir, relative_path=None, verbose=True):
         output_dir: Base output directory
         relative_path: Relative path from input root (preserves folder structure)
         verbose: Print progress messages
+        high_quality: Upscale with Lanczos instead of nearest/bilinear
+        png_level: zlib compression level for PNG output (0-9)
+        direct_io: Write PNGs with O_DIRECT, bypassing the page cache
+        preview_only: Only extract the preview image, skipping the raw data
+        raw_only: Only extract the raw ultrasound data, skipping the preview
 
     Returns tuple: (list of output file paths, is_settings_file boolean)
     """
@@ -164,83 +377,164 @@ def convert_file(input_path, output_dir, relative_path=None, verbose=True):
     base_name = input_path.stem
 
     try:
-        with h5py.File(input_path, 'r') as f:
+        # PNG encoding and writing run on writer threads (zlib releases the GIL),
+        # overlapping with reading the next image out of the HDF5 file
+        with open_hdf5(input_path) as f, \
+                ThreadPoolExecutor(max_workers=2) as writer:
+            pending = []
+
             # Check if this is a settings-only file
             if is_settings_file(f):
                 if verbose:
-                    tqdm.write(f"  Skipping: Settings/config file (no image data)")
+                    _log(f"  Skipping: Settings/config file (no image data)")
                 return output_files, True  # Return flag indicating settings file
-            # Try to extract raw ultrasound data
-            raw_data, raw_path = extract_raw_ultrasound(f)
+            try:
+                # Try to extract raw ultrasound data
+                raw_data, raw_path = None, None
+                if not preview_only:
+                    raw_data, raw_path = extract_raw_ultrasound(f)
 
-            if raw_data is not None:
-                if verbose:
-                    tqdm.write(f"  Found raw ultrasound data: {raw_data.shape}")
-
-                # Enhance and save
-                enhanced = enhance_ultrasound_image(raw_data)
-                img = Image.fromarray(enhanced)
-
-                # Scale up for better viewing (ultrasound scans are often narrow)
-                # Maintain aspect ratio but make it reasonable size
-                width, height = img.size
-                if width < 800:
-                    scale = 800 / width
-                    new_size = (int(width * scale), int(height * scale))
-                    img = img.resize(new_size, Image.Resampling.LANCZOS)
-
-                output_path = file_output_dir / f"{base_name}_ultrasound.png"
-                img.save(output_path)
-                output_files.append(output_path)
-                if verbose:
-                    tqdm.write(f"  Saved: {output_path}")
+                if raw_data is not None:
+                    if verbose:
+                        _log(f"  Found raw ultrasound data: {raw_data.shape}")
+
+                    # Enhance and save
+                    enhanced = enhance_ultrasound_image(raw_data)
+                    img = image_from_array(enhanced, 'L')
+
+                    # Scale up for better viewing (ultrasound scans are often narrow)
+                    # Maintain aspect ratio but make it reasonable size
+                    width, height = img.size
+                    if width < 800:
+                        scale = 800 / width
+                        new_size = (int(width * scale), int(height * scale))
+                        if high_quality:
+                            resample = Image.Resampling.LANCZOS
+                        elif 800 % width == 0:
+                            # Integer factor: nearest neighbour is exact and nearly free
+                            resample = Image.Resampling.NEAREST
+                        else:
+                            resample = Image.Resampling.BILINEAR
+                        img = img.resize(new_size, resample)
 
-            # Try to extract preview/titlebar image
-            preview_data, mode, preview_path = extract_preview_image(f)
+                    output_path = file_output_dir / f"{base_name}_ultrasound.png"
+                    future = writer.submit(save_png, img, output_path, png_level, direct_io)
+                    pending.append((future, output_path))
 
-            if preview_data is not None:
-                if verbose:
-                    tqdm.write(f"  Found preview image: {preview_data.shape}")
+                # Try to extract preview/titlebar image
+                preview_data, mode, preview_path = None, None, None
+                if not raw_only:
+                    preview_data, mode, preview_path = extract_preview_image(f)
 
-                img = Image.fromarray(preview_data, mode)
-                output_path = file_output_dir / f"{base_name}_preview.png"
-                img.save(output_path)
-                output_files.append(output_path)
-                if verbose:
-                    tqdm.write(f"  Saved: {output_path}")
+                if preview_data is not None:
+                    if verbose:
+                        _log(f"  Found preview image: {preview_data.shape}")
+
+                    img = image_from_array(preview_data, mode)
+                    output_path = file_output_dir / f"{base_name}_preview.png"
+                    future = writer.submit(save_png, img, output_path, png_level, direct_io)
+                    pending.append((future, output_path))
+            finally:
+                # Wait for queued writes before deciding whether to fall back,
+                # reporting every PNG written even if a later step raised
+                for future, output_path in pending:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        if verbose:
+                            _log(f"  Warning: Could not save {output_path}: {e}")
+                        continue
+                    output_files.append(output_path)
+                    if verbose:
+                        _log(f"  Saved: {output_path}")
 
-            # If neither worked, try to find any image-like data
-            if not output_files:
-                images = find_ultrasound_data(f)
-                for img_path, img_type in images[:3]:  # Limit to first 3
+            # If neither worked, try to find any image-like data (only when
+            # both kinds of image were asked for)
+            if not output_files and not (preview_only or raw_only):
+                images = find_ultrasound_data(f, limit=3)
+                for img_path, img_type in images:  # Limit to first 3
                     try:
                         data = f[img_path][:]
 
                         if img_type == 'grayscale_3d':
                             data = data[0] if data.shape[0] == 1 else data
 
-                        if len(data.shape) == 2:
-                            img = Image.fromarray(data)
+                        # Pick the PIL mode from the shape rather than letting PIL probe it
+                        if data.ndim == 2:
+                            mode = 'L'
+                        elif data.ndim == 3 and data.shape[2] in (3, 4):
+                            mode = 'RGB' if data.shape[2] == 3 else 'RGBA'
                         else:
-                            img = Image.fromarray(data)
+                            raise ValueError(f"unsupported image shape {data.shape}")
+                        img = image_from_array(data, mode)
 
                         safe_name = img_path.replace('/', '_')
                         output_path = file_output_dir / f"{base_name}_{safe_name}.png"
-                        img.save(output_path)
+                        save_png(img, output_path, png_level, direct_io)
                         output_files.append(output_path)
                         if verbose:
-                            tqdm.write(f"  Saved: {output_path}")
+                            _log(f"  Saved: {output_path}")
                     except Exception as e:
                         if verbose:
-                            tqdm.write(f"  Warning: Could not extract {img_path}: {e}")
+                            _log(f"  Warning: Could not extract {img_path}: {e}")
 
     except Exception as e:
         if verbose:
-            tqdm.write(f"  Error processing {input_path}: {e}")
+            _log(f"  Error processing {input_path}: {e}")
 
     return output_files, False  # Not a settings file
 
 
+def _scan_files(root, extensions):
+    """
+    Recursively yield path strings of files under root whose names end with
+    one of extensions.
+
+    Walks the tree once with os.scandir; extensions are lowercase and matched
+    case-insensitively.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _iter_files(root, extensions):
+    """Like _scan_files, but yields Path objects."""
+    return (Path(path) for path in _scan_files(root, extensions))
+
+
+def _fast_copy(src, dst):
+    """
+    Copy src to dst with metadata, like shutil.copy2.
+
+    Uses os.copy_file_range where available so the kernel copies the data,
+    or shares extents on filesystems with reflinks (btrfs, XFS). Falls back
+    to a buffered copy on other platforms or filesystems.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            # Continue from wherever the kernel copy stopped
+            pass
+        shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+
+    shutil.copystat(src, dst)
+
+
 def copy_jpeg_files(input_folder, output_folder, verbose=True):
     """
     Find and copy all JPEG files from input folder to output folder.
@@ -253,11 +547,7 @@ def copy_jpeg_files(input_folder, output_folder, verbose=True):
     output_folder = Path(output_folder)
 
     # Find all JPEG files
-    jpeg_files = []
-    for ext in ['*.jpg', '*.jpeg', '*.JPG', '*.JPEG']:
-        jpeg_files.extend(input_folder.rglob(ext))
-
-    jpeg_files = sorted(set(jpeg_files))
+    jpeg_files = sorted(_iter_files(input_folder, ('.jpg', '.jpeg')))
 
     stats = {'copied': 0, 'files': []}
 
@@ -283,7 +573,7 @@ def copy_jpeg_files(input_folder, output_folder, verbose=True):
             dest_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Copy the file
-            shutil.copy2(file_path, dest_path)
+            _fast_copy(file_path, dest_path)
             stats['copied'] += 1
             stats['files'].append(dest_path)
 
@@ -297,7 +587,175 @@ def copy_jpeg_files(input_folder, output_folder, verbose=True):
     return stats
 
 
-def convert_folder(input_folder, output_folder=None, copy_jpeg=False, delete_source=False, verbose=True):
+# Fingerprint cache loaded into each worker process by _init_worker
+_fingerprint_cache = {}
+
+
+def load_fingerprint_cache(output_folder):
+    """Load the settings fingerprint cache from output_folder, if any."""
+    try:
+        with open(Path(output_folder) / FINGERPRINT_CACHE_NAME) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # Drop entries for image files left by older versions of the cache
+    return {fingerprint: kind for fingerprint, kind in cache.items() if kind == 'settings'}
+
+
+def save_fingerprint_cache(output_folder, cache):
+    """Write the fingerprint cache to output_folder."""
+    with open(Path(output_folder) / FINGERPRINT_CACHE_NAME, 'w') as f:
+        json.dump(cache, f)
+
+
+def _file_fingerprint(size, header):
+    """Identify a file by its size and a hash of its first bytes."""
+    return f"{size}:{hashlib.blake2b(header, digest_size=16).hexdigest()}"
+
+
+def _init_worker(fingerprint_cache=None):
+    """
+    Prepare a worker process: register HDF5 compression filters once, up
+    front, and load the fingerprint cache.
+    """
+    global _fingerprint_cache
+    _fingerprint_cache = fingerprint_cache or {}
+
+    # Querying each filter makes HDF5 search for and load any plugin now,
+    # instead of on the first file that needs it
+    h5py.get_config()
+    for filter_id in HDF5_FILTER_IDS:
+        try:
+            h5py.h5z.filter_avail(filter_id)
+        except Exception:
+            pass
+
+
+def _is_settings_path(file_path):
+    """Open an HDF5 file just long enough to check whether it is settings-only."""
+    try:
+        with open_hdf5(file_path) as f:
+            return is_settings_file(f)
+    except Exception:
+        return False
+
+
+def _delete_source(file_path, stats, verbose=True):
+    """Delete a source file, counting it in stats['deleted']."""
+    try:
+        file_path.unlink()
+        stats['deleted'] += 1
+        if verbose:
+            _log(f"  Deleted: {file_path.name}")
+    except Exception as e:
+        if verbose:
+            _log(f"  Warning: Could not delete {file_path.name}: {e}")
+
+
+def _process_one(*args, **kwargs):
+    """
+    Convert one file found by convert_folder in a worker process.
+
+    Takes the same picklable arguments as _convert_one and returns its stats
+    dict for the parent to merge. Progress messages are collected in
+    stats['messages'] rather than printed, so the parent can write each
+    file's messages together.
+    """
+    global _log_buffer
+    _log_buffer = []
+    try:
+        stats = _convert_one(*args, **kwargs)
+    finally:
+        messages, _log_buffer = _log_buffer, None
+    stats['messages'] = messages
+    return stats
+
+
+def _convert_one(file_path, input_folder, output_folder, delete_source=False, verbose=True,
+                 high_quality=False, png_level=DEFAULT_PNG_LEVEL, direct_io=False, preview_only=False,
+                 raw_only=False, size_threshold=SETTINGS_SIZE_THRESHOLD):
+    """Convert one file found by convert_folder, returning a stats dict."""
+    stats = {'converted': 0, 'skipped': 0, 'below_threshold': 0, 'failed': 0, 'deleted': 0, 'output_files': []}
+
+    # Calculate relative path from input folder to preserve structure
+    try:
+        relative_path = file_path.relative_to(input_folder)
+    except ValueError:
+        relative_path = Path(file_path.name)
+
+    if verbose:
+        _log(f"Processing: {relative_path}")
+
+    # Check if it's actually an HDF5 file, reading the size and the
+    # fingerprint header from the same handle
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(FINGERPRINT_BYTES)
+            signature = header[:8]
+            size = os.fstat(f.fileno()).st_size
+
+        if signature[:4] != b'\x89HDF':
+            if verbose:
+                _log(f"  Skipping: Not an HDF5 file")
+            stats['skipped'] += 1
+            return stats
+    except Exception as e:
+        if verbose:
+            _log(f"  Skipping: Cannot read file ({e})")
+        stats['skipped'] += 1
+        return stats
+
+    # Small files and files seen before as settings-only are skipped
+    # without opening HDF5
+    fingerprint = _file_fingerprint(size, header)
+    below_threshold = size < size_threshold
+    if below_threshold or _fingerprint_cache.get(fingerprint) == 'settings':
+        # Deleting needs proof the file is settings-only, so only then is it
+        # opened; whether it is converted never depends on delete_source
+        if delete_source and _is_settings_path(file_path):
+            if verbose:
+                _log(f"  Skipping: Settings/config file (no image data)")
+            stats['skipped'] += 1
+            _delete_source(file_path, stats, verbose)
+        elif below_threshold:
+            if verbose:
+                _log(f"  Skipping: Below size threshold ({size} bytes, not checked)")
+            stats['below_threshold'] += 1
+        else:
+            if verbose:
+                _log(f"  Skipping: Settings/config file (cached)")
+            stats['skipped'] += 1
+        return stats
+
+    # Convert the file (pass relative_path to preserve folder structure)
+    output_files, is_settings = convert_file(file_path, output_folder, relative_path, verbose, high_quality,
+                                             png_level, direct_io, preview_only, raw_only)
+
+    if is_settings:
+        stats['fingerprint'] = fingerprint
+        stats['skipped'] += 1  # Settings files are skipped
+        # Delete settings files too if delete_source is enabled
+        if delete_source:
+            _delete_source(file_path, stats, verbose)
+    elif output_files:
+        stats['converted'] += 1
+        stats['output_files'].extend(output_files)
+        # Delete source file after successful conversion
+        if delete_source:
+            _delete_source(file_path, stats, verbose)
+    else:
+        stats['failed'] += 1
+        if verbose:
+            _log(f"  Failed: No image data found")
+
+    return stats
+
+
+def convert_folder(input_folder, output_folder=None, copy_jpeg=False, delete_source=False, verbose=True,
+                   workers=None, high_quality=False, png_level=DEFAULT_PNG_LEVEL, direct_io=False,
+                   preview_only=False, raw_only=False, size_threshold=SETTINGS_SIZE_THRESHOLD):
     """
     Convert all .usr and .raw files in a folder to PNG.
 
@@ -307,10 +765,26 @@ def convert_folder(input_folder, output_folder=None, copy_jpeg=False, delete_sou
         copy_jpeg: If True, also copy JPEG files to output folder
         delete_source: If True, delete source .raw/.usr files after successful conversion
         verbose: Print progress messages
+        workers: Number of worker processes (default: os.cpu_count())
+        high_quality: Upscale narrow scans with Lanczos instead of nearest/bilinear
+        png_level: zlib compression level for PNG output (0-9)
+        direct_io: Write PNGs with O_DIRECT, bypassing the page cache
+        preview_only: Only extract preview images, skipping the raw data
+        raw_only: Only extract raw ultrasound images, skipping the previews
+        size_threshold: Skip files smaller than this many bytes as settings-only
+            without opening them (0 disables)
 
     Returns:
-        dict with 'converted', 'skipped', 'failed', 'jpeg_copied', 'deleted' counts
+        dict with 'converted', 'skipped', 'below_threshold', 'failed', 'jpeg_copied', 'deleted' counts;
+        'below_threshold' counts files skipped for size alone, without checking their contents
+
+    Raises:
+        ValueError: if delete_source is combined with preview_only or raw_only
     """
+    # A partial conversion must never be followed by deleting the source
+    if delete_source and (preview_only or raw_only):
+        raise ValueError("delete_source cannot be combined with preview_only or raw_only")
+
     input_folder = Path(input_folder)
 
     if output_folder is None:
@@ -320,85 +794,81 @@ def convert_folder(input_folder, output_folder=None, copy_jpeg=False, delete_sou
 
     output_folder.mkdir(parents=True, exist_ok=True)
 
-    # Find all .usr and .raw files
-    target_files = []
-    for ext in ['*.usr', '*.raw', '*.USR', '*.RAW']:
-        target_files.extend(input_folder.rglob(ext))
+    # Count .usr and .raw files for the progress bar without building Path
+    # objects; the files themselves are streamed to the workers below
+    extensions = ('.usr', '.raw')
+    total_files = sum(1 for _ in _scan_files(input_folder, extensions))
 
-    # Remove duplicates and sort
-    target_files = sorted(set(target_files))
+    if workers is None:
+        workers = os.cpu_count() or 1
 
     if verbose:
-        print(f"Found {len(target_files)} .usr/.raw files in {input_folder}")
+        print(f"Found {total_files} .usr/.raw files in {input_folder}")
         print(f"Output folder: {output_folder}")
+        print(f"Workers: {workers}")
+        # Pillow-SIMD builds carry a .postN suffix, so this also shows which is installed
+        print(f"Pillow: {PIL.__version__}")
         print()
 
-    stats = {'converted': 0, 'skipped': 0, 'failed': 0, 'jpeg_copied': 0, 'deleted': 0, 'output_files': []}
+    stats = {'converted': 0, 'skipped': 0, 'below_threshold': 0, 'failed': 0, 'jpeg_copied': 0, 'deleted': 0,
+             'output_files': []}
+
+    fingerprint_cache = load_fingerprint_cache(output_folder)
+    cache_size = len(fingerprint_cache)
 
     # Create progress bar
-    pbar = tqdm(target_files, desc="Converting", unit="file", disable=False)
+    pbar = tqdm(total=total_files, desc="Converting", unit="file", disable=False)
+
+    # Each file is independent, so convert them in parallel across processes.
+    # Files are submitted as the walk finds them, keeping only a few per worker
+    # in flight instead of a future for every file in the tree.
+    target_files = _iter_files(input_folder, extensions)
+    max_pending = workers * 4
+    pending = {}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(fingerprint_cache,)) as executor:
+        while True:
+            for file_path in itertools.islice(target_files, max_pending - len(pending)):
+                future = executor.submit(_process_one, file_path, input_folder, output_folder, delete_source,
+                                         verbose, high_quality, png_level, direct_io, preview_only, raw_only,
+                                         size_threshold)
+                pending[future] = file_path
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path = pending.pop(future)
+                try:
+                    file_stats = future.result()
+                except Exception as e:
+                    if verbose:
+                        tqdm.write(f"  Error processing {file_path}: {e}")
+                    file_stats = {'failed': 1}
 
-    for file_path in pbar:
-        # Calculate relative path from input folder to preserve structure
-        try:
-            relative_path = file_path.relative_to(input_folder)
-        except ValueError:
-            relative_path = Path(file_path.name)
+                for message in file_stats.get('messages', []):
+                    tqdm.write(message)
 
-        # Update progress bar description
-        pbar.set_postfix_str(f"{relative_path.name[:30]}")
+                for key in ('converted', 'skipped', 'below_threshold', 'failed', 'deleted'):
+                    stats[key] += file_stats.get(key, 0)
+                stats['output_files'].extend(file_stats.get('output_files', []))
+                if 'fingerprint' in file_stats:
+                    fingerprint_cache[file_stats['fingerprint']] = 'settings'
 
-        if verbose:
-            tqdm.write(f"Processing: {relative_path}")
+                # Update progress bar
+                pbar.set_postfix_str(f"{file_path.name[:30]}")
+                pbar.update(1)
 
-        # Check if it's actually an HDF5 file
-        try:
-            with open(file_path, 'rb') as f:
-                signature = f.read(8)
+    pbar.close()
 
-            if signature[:4] != b'\x89HDF':
-                if verbose:
-                    tqdm.write(f"  Skipping: Not an HDF5 file")
-                stats['skipped'] += 1
-                continue
-        except Exception as e:
-            if verbose:
-                tqdm.write(f"  Skipping: Cannot read file ({e})")
-            stats['skipped'] += 1
-            continue
-
-        # Convert the file (pass relative_path to preserve folder structure)
-        output_files, is_settings = convert_file(file_path, output_folder, relative_path, verbose)
-
-        if is_settings:
-            stats['skipped'] += 1  # Settings files are skipped
-            # Delete settings files too if delete_source is enabled
-            if delete_source:
-                try:
-                    file_path.unlink()
-                    stats['deleted'] += 1
-                    if verbose:
-                        tqdm.write(f"  Deleted: {file_path.name}")
-                except Exception as e:
-                    if verbose:
-                        tqdm.write(f"  Warning: Could not delete {file_path.name}: {e}")
-        elif output_files:
-            stats['converted'] += 1
-            stats['output_files'].extend(output_files)
-            # Delete source file after successful conversion
-            if delete_source:
-                try:
-                    file_path.unlink()
-                    stats['deleted'] += 1
-                    if verbose:
-                        tqdm.write(f"  Deleted: {file_path.name}")
-                except Exception as e:
-                    if verbose:
-                        tqdm.write(f"  Warning: Could not delete {file_path.name}: {e}")
-        else:
-            stats['failed'] += 1
+    if len(fingerprint_cache) != cache_size:
+        try:
+            save_fingerprint_cache(output_folder, fingerprint_cache)
+        except OSError as e:
             if verbose:
-                tqdm.write(f"  Failed: No image data found")
+                tqdm.write(f"Warning: Could not save fingerprint cache: {e}")
 
     # Copy JPEG files if requested
     if copy_jpeg:
@@ -431,9 +901,32 @@ Examples:
                         help='Also copy JPEG files to output folder')
     parser.add_argument('-d', '--delete-source', action='store_true',
                         help='Delete source .raw/.usr files after successful conversion')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='Number of worker processes (default: number of CPUs)')
+    parser.add_argument('--high-quality', action='store_true',
+                        help='Upscale narrow scans with Lanczos resampling (slower)')
+    parser.add_argument('--png-level', type=int, default=DEFAULT_PNG_LEVEL, choices=range(10), metavar='N',
+                        help=f'PNG compression level 0-9 (default: {DEFAULT_PNG_LEVEL}; higher is smaller but slower)')
+    parser.add_argument('--direct-io', action='store_true',
+                        help='Write PNGs with O_DIRECT to keep large batches out of the page cache (Linux)')
+    parser.add_argument('--size-threshold', type=int, default=SETTINGS_SIZE_THRESHOLD, metavar='BYTES',
+                        help=f'Skip files smaller than this as settings-only without opening them '
+                             f'(default: {SETTINGS_SIZE_THRESHOLD}; 0 converts every file)')
+    only_group = parser.add_mutually_exclusive_group()
+    only_group.add_argument('--preview-only', action='store_true',
+                            help='Only extract preview images, skipping the slower raw ultrasound data')
+    only_group.add_argument('--raw-only', action='store_true',
+                            help='Only extract raw ultrasound images, skipping the previews')
 
     args = parser.parse_args()
 
+    if args.workers is not None and args.workers < 1:
+        parser.error('--workers must be at least 1')
+
+    # Same check convert_folder makes, reported as a usage error
+    if args.delete_source and (args.preview_only or args.raw_only):
+        parser.error('--delete-source cannot be combined with --preview-only or --raw-only')
+
     if not os.path.isdir(args.input_folder):
         print(f"Error: '{args.input_folder}' is not a valid directory")
         sys.exit(1)
@@ -443,13 +936,22 @@ Examples:
         args.output_folder,
         copy_jpeg=args.copy_jpeg,
         delete_source=args.delete_source,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        workers=args.workers,
+        high_quality=args.high_quality,
+        png_level=args.png_level,
+        direct_io=args.direct_io,
+        preview_only=args.preview_only,
+        raw_only=args.raw_only,
+        size_threshold=args.size_threshold
     )
 
     print("=" * 50)
     print(f"Conversion complete!")
     print(f"  RAW files converted: {stats['converted']}")
     print(f"  Files skipped:       {stats['skipped']}")
+    if stats['below_threshold']:
+        print(f"  Below size threshold:{stats['below_threshold']} (not checked; --size-threshold 0 converts them)")
     print(f"  Files failed:        {stats['failed']}")
     if args.copy_jpeg:
         print(f"  JPEGs copied:        {stats['jpeg_copied']}")